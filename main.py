@@ -3,10 +3,14 @@ import time
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QLabel,
     QFrame, QCheckBox, QSpinBox, QSlider, QColorDialog, QPushButton,
-    QHBoxLayout, QComboBox
+    QHBoxLayout, QComboBox, QButtonGroup
+)
+from PyQt6.QtCore import (
+    Qt, QRect, QTimer, QSignalBlocker, QFile, QIODevice, QTextStream
+)
+from PyQt6.QtGui import (
+    QPainter, QPen, QBrush, QColor, QIcon, QAction, QPixmap
 )
-from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QIcon, QAction
 
 from modules import SerialConnection, AudioVisualizer, ScreenResponsive
 
@@ -17,28 +21,30 @@ class LEDControllerUI(QMainWindow):
     A class to represent the main UI for the LED Controller application.
     Attributes
     ----------
-    R : int
-        Red color value (0-255).
-    G : int
-        Green color value (0-255).
-    B : int
-        Blue color value (0-255).
-    pattern_buttons : list
-        List of pattern buttons.
-    selected_button : QPushButton or None
-        Currently selected pattern button.
+    rgb : bytearray
+        Red, green and blue color values (0-255), indexed 0, 1 and 2.
+    pattern_group : QButtonGroup
+        Exclusive group of pattern buttons.
     music : bool
         Flag to indicate if music mode is enabled.
     FPS : int
         Frames per second for screen reactive mode.
-    last_update_time : float
-        Timestamp of the last update.
+    last_update_time : int
+        Monotonic timestamp of the last update, in nanoseconds.
     conn : SerialConnection
         Serial connection to the LED controller.
+    visualizer : AudioVisualizer or None
+        Audio visualizer, created with the Audio Reactive tab.
+    current_tab_index : int
+        Index of the currently active tab.
     screen_responsive : ScreenResponsive
         Screen responsive handler.
     settings_window : SettingsWindow
         Settings window instance.
+    color_timer : QTimer
+        Single-shot timer coalescing color updates before they are sent.
+    color_dialog : QColorDialog or None
+        Color picker dialog, created on first use and reused afterwards.
     Methods
     -------
     __init__():
@@ -65,18 +71,20 @@ class LEDControllerUI(QMainWindow):
         Create the Audio Reactive tab.
     create_screen_reactive_tab():
         Create the Screen Reactive tab.
-    toggle_rgb_controls(state, value_box, slider, color):
+    toggle_rgb_controls(state, value_box, slider, idx):
         Enable or disable RGB controls based on checkbox state.
-    value_box_control(sl, value, color):
+    value_box_control(sl, value, idx):
         Sync the value box and slider values.
-    slider_control(vb, value):
+    slider_control(vb, value, idx):
         Sync the slider and value box values.
-    update_color(value, color):
-        Update the color values and send to the connection.
+    update_color(value, idx):
+        Update the color values and schedule sending them.
+    schedule_color():
+        Schedule sending the current color values.
+    flush_color():
+        Send the current color values to the connection.
     open_color_picker():
         Open the color picker dialog.
-    select_pattern():
-        Select a pattern from the pattern tab.
     open_screen_dimension_selector():
         Open the screen dimension selector.
     update_capturing_label(x1, y1, x2, y2):
@@ -85,6 +93,8 @@ class LEDControllerUI(QMainWindow):
         Clear the capturing label.
     update_fps(value):
         Update the FPS value.
+    update_color_method(method):
+        Update how the screen color is picked.
     start_screen_capture():
         Start the screen capture.
     stop_screen_capture():
@@ -99,37 +109,44 @@ class LEDControllerUI(QMainWindow):
         creates the main layout with tabs and an options menu.
         It also connects actions to their respective functions.
         Attributes:
-            R (int): Red color value.
-            G (int): Green color value.
-            B (int): Blue color value.
-            pattern_buttons (list): List of pattern buttons.
-            selected_button (QPushButton): Currently selected button.
+            rgb (bytearray): Red, green and blue color values.
             music (bool): Flag to indicate if music mode is active.
             FPS (int): Frames per second for updates.
-            last_update_time (float): Timestamp of the last update.
+            last_update_time (int): Monotonic timestamp of the last update,
+                in nanoseconds.
             conn (SerialConnection): Serial connection object.
+            visualizer (AudioVisualizer): Audio visualizer object.
+            current_tab_index (int): Index of the currently active tab.
             screen_responsive (ScreenResponsive): Screen responsive object.
             settings_window (SettingsWindow): Settings window object.
+            color_timer (QTimer): Timer coalescing color updates.
+            color_dialog (QColorDialog): Reused color picker dialog.
         """
 
         super().__init__()
         self.setWindowTitle("Jhagmag")
-        self.setFixedSize(500, 400)
+        self.setMinimumSize(500, 400)
+        self.resize(500, 400)
         self.setWindowIcon(QIcon("assets/icon.ico"))
 
         # Variables
-        self.R = 0
-        self.G = 0
-        self.B = 0
-        self.pattern_buttons = []
-        self.selected_button = None
+        self.rgb = bytearray(3)  # Red, green and blue color values
         self.music = False
         self.FPS = 10
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic_ns()
         self.conn = SerialConnection(port="COM11")
+        self.visualizer = None  # Created by create_audio_reactive_tab
+        self.current_tab_index = 0
         self.screen_responsive = ScreenResponsive(self.conn)
         self.settings_window = SettingsWindow(self.conn)
 
+        # Coalesce bursts of color changes into a single serial write
+        self.color_timer = QTimer(self)
+        self.color_timer.setSingleShot(True)
+        self.color_timer.setInterval(15)
+        self.color_timer.timeout.connect(self.flush_color)
+        self.color_dialog = None  # Created on first use
+
         # Main layout
         main_layout = QVBoxLayout()
 
@@ -279,8 +296,9 @@ class LEDControllerUI(QMainWindow):
 
         """
         Handle tab change events.
-        This method is called when the tab is changed. It performs different
-        actions based on the index of the selected tab:
+        This method is called when the tab is changed. It deactivates the
+        current tab and performs different actions based on the index of the
+        selected tab:
         - If the index is 0, it disables the timeout and sends the current
             color values.
         - If the index is 1, it disables the timeout and sets the mode based
@@ -291,14 +309,16 @@ class LEDControllerUI(QMainWindow):
         """
 
         self.unactiveTab()
+        self.current_tab_index = index
 
         if index == 0:
             self.conn.send_timeout(False)
-            self.conn.send_color(self.R, self.G, self.B)
+            self.flush_color()
         elif index == 1:
             self.conn.send_timeout(False)
-            if self.selected_button:
-                self.conn.set_mode(self.selected_button.text())
+            selected_button = self.pattern_group.checkedButton()
+            if selected_button:
+                self.conn.set_mode(selected_button.text())
         elif index == 2:
             self.conn.send_timeout(True)
             self.visualizer.start()
@@ -306,21 +326,34 @@ class LEDControllerUI(QMainWindow):
     def unactiveTab(self):
 
         """
-        Deactivate the current tab by setting the connection mode to "OFF" and
-        stopping any running visualizer or screen responsiveness processes.
+        Deactivate the current tab by stopping any running visualizer or
+        screen responsiveness processes and, only if something was driving
+        the LEDs, setting the connection mode to "OFF".
 
         This method performs the following actions:
-        1. Sets the connection mode to "OFF".
+        1. Stops the color timer, so a pending Solid tab color cannot
+            override what the new tab sends.
         2. Stops the visualizer if it is running.
-        3. Stops the screen responsiveness process if it is running.
+        3. Stops the screen responsiveness process if it is running, which
+            sets the mode to "OFF" itself.
+        4. Sets the connection mode to "OFF" if the visualizer was stopped,
+            a color is being left lit on the Solid tab or a pattern is being
+            left running on the Pattern tab.
         """
 
-        self.conn.set_mode("OFF")
-        if hasattr(self, 'visualizer') and self.visualizer.is_running():
+        send_off = (
+            self.current_tab_index == 0 and any(self.rgb)
+            or self.current_tab_index == 1
+            and self.pattern_group.checkedButton() is not None
+        )
+        self.color_timer.stop()
+        if self.visualizer is not None and self.visualizer.is_running():
             self.visualizer.stop()
-        if hasattr(self, 'screen_responsive') \
-                and self.screen_responsive.is_running():
+            send_off = True
+        if self.screen_responsive.is_running():
             self.screen_responsive.stop()
+        if send_off:
+            self.conn.set_mode("OFF")
 
     def create_solid_tab(self):
 
@@ -345,29 +378,29 @@ class LEDControllerUI(QMainWindow):
         layout = QVBoxLayout()
 
         # Color Sliders and Checkboxes
-        for color in ["Red", "Green", "Blue"]:
+        for idx, color in enumerate(["Red", "Green", "Blue"]):
             checkbox = QCheckBox(color)
             value_box = QSpinBox()
             value_box.setRange(0, 255)
             value_box.setValue(128)
             value_box.setEnabled(False)  # Initially disabled
-            value_box.setFixedWidth(100)
+            value_box.setMinimumWidth(80)
 
             slider = QSlider(Qt.Orientation.Horizontal)
             slider.setRange(0, 255)
             slider.setValue(128)
             slider.setEnabled(False)  # Initially disabled
-            slider.setFixedWidth(250)
 
             # Sync the value box and slider values
             value_box.valueChanged.connect(
                 lambda val,
                 sl=slider,
-                color=color: self.value_box_control(sl, val, color)
+                idx=idx: self.value_box_control(sl, val, idx)
             )
-            slider.sliderReleased.connect(
-                lambda vb=value_box,
-                sl=slider: self.slider_control(vb, sl.value())
+            slider.sliderMoved.connect(
+                lambda val,
+                vb=value_box,
+                idx=idx: self.slider_control(vb, val, idx)
             )
 
             # Enable/disable the slider and value box based on checkbox state
@@ -375,7 +408,7 @@ class LEDControllerUI(QMainWindow):
                 lambda state,
                 vb=value_box,
                 sl=slider,
-                color=color: self.toggle_rgb_controls(state, vb, sl, color)
+                idx=idx: self.toggle_rgb_controls(state, vb, sl, idx)
             )
 
             # Add widgets to layout
@@ -383,6 +416,7 @@ class LEDControllerUI(QMainWindow):
             hlayout.addWidget(checkbox)
             hlayout.addWidget(value_box)
             hlayout.addWidget(slider)
+            hlayout.setStretch(2, 1)  # The slider takes the spare width
             layout.addLayout(hlayout)
 
         # Color Picker
@@ -399,8 +433,9 @@ class LEDControllerUI(QMainWindow):
         Create the Pattern tab with buttons for different LED patterns.
         This method creates a new QFrame and sets up a QVBoxLayout. It then
         creates a series of QPushButton widgets for each pattern in the
-        predefined list of patterns. Each button is made checkable and
-        connected to the select_pattern method. The buttons are added to the
+        predefined list of patterns. Each button is made checkable and added
+        to an exclusive QButtonGroup, which keeps at most one pattern checked
+        and sets the mode of the clicked button. The buttons are added to the
         layout, which is then set on the frame.
         Returns:
             QFrame: The frame containing the layout with pattern buttons.
@@ -411,11 +446,16 @@ class LEDControllerUI(QMainWindow):
 
         # Pattern Buttons
         patterns = ["Fade", "Cycle", "Rainbow Cycle", "Breathing", "Random"]
-        for pattern in patterns:
-            button = QPushButton(pattern)
+        buttons = [QPushButton(pattern) for pattern in patterns]
+
+        self.pattern_group = QButtonGroup(self)
+        self.pattern_group.setExclusive(True)
+        self.pattern_group.buttonClicked.connect(
+            lambda button: self.conn.set_mode(button.text())
+        )
+        for button in buttons:
             button.setCheckable(True)
-            button.clicked.connect(self.select_pattern)
-            self.pattern_buttons.append(button)
+            self.pattern_group.addButton(button)
             layout.addWidget(button)
 
         frame.setLayout(layout)
@@ -450,6 +490,7 @@ class LEDControllerUI(QMainWindow):
         including:
         - A frame and main vertical layout.
         - FPS setting with a label and spin box.
+        - Color method setting with a label and combo box.
         - A label to display the capturing status.
         - A button to select screen dimensions.
         - A button to clear the capturing label.
@@ -474,6 +515,21 @@ class LEDControllerUI(QMainWindow):
         fps_layout.addWidget(fps_label)
         fps_layout.addWidget(fps_box)
 
+        # Color method setting, each item carries its ScreenResponsive method
+        method_label = QLabel("Color:")
+        method_box = QComboBox()
+        method_box.addItem("Average", "mean")
+        method_box.addItem("Most Common", "histogram")
+        method_box.addItem("Largest Cluster", "kmeans")
+        method_box.currentIndexChanged.connect(
+            lambda _: self.update_color_method(method_box.currentData())
+        )
+
+        # Add a horizontal layout for color method setting
+        method_layout = QHBoxLayout()
+        method_layout.addWidget(method_label)
+        method_layout.addWidget(method_box)
+
         # Add a label for capturing status
         self.capturing_label = QLabel("Capturing: Full Screen")
         self.capturing_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -506,6 +562,7 @@ class LEDControllerUI(QMainWindow):
 
         # Add all widgets to the main layout
         layout.addLayout(fps_layout)
+        layout.addLayout(method_layout)
         layout.addWidget(
             self.capturing_label, alignment=Qt.AlignmentFlag.AlignCenter
         )
@@ -516,7 +573,7 @@ class LEDControllerUI(QMainWindow):
         return frame
 
     # Solic Tab Functions
-    def toggle_rgb_controls(self, state, value_box, slider, color):
+    def toggle_rgb_controls(self, state, value_box, slider, idx):
 
         """
         Enable or disable RGB controls based on checkbox state.
@@ -525,122 +582,124 @@ class LEDControllerUI(QMainWindow):
             (0 for unchecked, non-zero for checked).
         value_box (QSpinBox): The spin box widget for the RGB value.
         slider (QSlider): The slider widget for the RGB value.
-        color (str): The color to be controlled ("Red", "Green", or "Blue").
+        idx (int): The channel to be controlled (0 for red, 1 for green,
+            2 for blue).
         Returns:
         None
         """
 
         enabled = state != 0
 
-        if color == "Red":
-            self.R = 0 if not enabled else value_box.value()
-        elif color == "Green":
-            self.G = 0 if not enabled else value_box.value()
-        elif color == "Blue":
-            self.B = 0 if not enabled else value_box.value()
+        self.rgb[idx] = value_box.value() if enabled else 0
 
-        self.conn.send_color(self.R, self.G, self.B)
+        self.schedule_color()
 
         value_box.setEnabled(enabled)
         slider.setEnabled(enabled)
 
-    def value_box_control(self, sl, value, color):
+    def value_box_control(self, sl, value, idx):
 
         """
         Sync the value box and slider values.
 
+        The slider's signals are blocked while its value is set so that the
+        programmatic change does not fan back out through Qt.
+
         Parameters:
         sl (QSlider): The slider widget to update.
         value (int): The value to set on the slider.
-        color (str): The color to update in the value box.
+        idx (int): The channel to update (0 for red, 1 for green, 2 for
+            blue).
 
         Returns:
         None
         """
 
-        sl.setValue(value)
-        self.update_color(value, color)
+        with QSignalBlocker(sl):
+            sl.setValue(value)
+        self.update_color(value, idx)
 
-    def slider_control(self, vb, value):
+    def slider_control(self, vb, value, idx):
 
         """
         Sync the slider and value box values.
 
+        Called while the user drags the slider. The value box's signals are
+        blocked while its value is set, so the color is updated once here
+        instead of again through `value_box_control`.
+
         Parameters:
             vb (QWidget): The value box widget to be updated.
             value (int): The value to set in the value box.
+            idx (int): The channel to update (0 for red, 1 for green,
+                2 for blue).
         """
 
-        vb.setValue(value)
+        with QSignalBlocker(vb):
+            vb.setValue(value)
+        self.update_color(value, idx)
 
-    def update_color(self, value, color):
+    def update_color(self, value, idx):
         """
-        Update the color values and send to the connection.
+        Update the color values and schedule sending them to the connection.
+        Sending is coalesced by `color_timer`, so dragging a slider sends
+        the latest color at most every 15 ms instead of on every step.
         Args:
-            value (int): The new value for the specified color.
-            color (str): The color to update.
-                Should be one of "Red", "Green", or "Blue".
-        Raises:
-            ValueError: If the color is not one of "Red", "Green", or "Blue".
+            value (int): The new value for the specified channel.
+            idx (int): The channel to update.
+                Should be 0 for red, 1 for green or 2 for blue.
         """
 
-        if color == "Red":
-            self.R = value
-        elif color == "Green":
-            self.G = value
-        elif color == "Blue":
-            self.B = value
+        self.rgb[idx] = value
 
-        self.conn.send_color(self.R, self.G, self.B)
+        self.schedule_color()
 
-    def open_color_picker(self):
+    def schedule_color(self):
 
         """
-        Opens a color picker dialog for the user to select a color.
-
-        If a valid color is selected, the RGB values are extracted and sent
-        to the connected device.
+        Schedule sending the current color values to the connection.
 
-        Attributes:
-            self.R (int): Red component of the selected color.
-            self.G (int): Green component of the selected color.
-            self.B (int): Blue component of the selected color.
+        The timer is only started if it is not already pending, so a burst of
+        updates results in one write of the latest color at most every 15 ms.
         """
 
-        color = QColorDialog.getColor()
-        if color.isValid():
-            self.R, self.G, self.B = color.red(), color.green(), color.blue()
-            self.conn.send_color(self.R, self.G, self.B)
+        if not self.color_timer.isActive():
+            self.color_timer.start()
 
-    # Pattern Tab Functions
-    def select_pattern(self):
+    def flush_color(self):
 
         """
-        Handles the selection of a pattern from the pattern tab.
-        This method is triggered when a pattern button is clicked. It checks
-        if the clicked button is the same as the currently selected button.
-        If it is, the button remains checked and the method returns. If a
-        different button is clicked, the previously selected button is
-        unchecked, and the clicked button is marked as the new selected button.
-        The mode is then set based on the text of the clicked button.
-        Returns:
-            None
+        Send the current color values to the connection.
+
+        This method is called by `color_timer` when a scheduled send is due.
+        Repeated colors, e.g. when a checkbox zeroes a channel that was
+        already zero, are dropped by the connection itself.
         """
 
-        clicked_button = self.sender()
+        self.conn.send_color(*self.rgb)
 
-        if clicked_button == self.selected_button:
-            clicked_button.setChecked(True)
-            return
+    def open_color_picker(self):
+
+        """
+        Opens a color picker dialog for the user to select a color.
 
-        if self.selected_button:
-            self.selected_button.setChecked(False)
+        The dialog is created on first use and reused afterwards, starting
+        from the current color. If a color is accepted, the RGB values are
+        extracted and sent to the connected device.
 
-        # Mark the clicked button as the selected one
-        self.selected_button = clicked_button \
-            if clicked_button.isChecked() else None
+        Attributes:
+            self.rgb (bytearray): Red, green and blue components of the
+                selected color.
+        """
 
-        self.conn.set_mode(clicked_button.text())
+        if self.color_dialog is None:
+            self.color_dialog = QColorDialog(self)
+        self.color_dialog.setCurrentColor(QColor(*self.rgb))
+
+        if self.color_dialog.exec():
+            red, green, blue, _ = self.color_dialog.currentColor().getRgb()
+            self.rgb[:] = bytes((red, green, blue))
+            self.schedule_color()
 
     # Screen Reactive Tab Functions
     def open_screen_dimension_selector(self):
@@ -704,6 +763,18 @@ class LEDControllerUI(QMainWindow):
         self.FPS = value
         self.screen_responsive.update_fps(value)
 
+    def update_color_method(self, method):
+
+        """
+        Update how the screen color is picked.
+
+        Args:
+            method (str): The ScreenResponsive method, "mean", "histogram"
+                or "kmeans".
+        """
+
+        self.screen_responsive.update_method(method)
+
     def start_screen_capture(self):
 
         """
@@ -842,6 +913,8 @@ class ScreenDimensionSelector(QWidget):
             called when the selection is complete.
         confirm_button (QPushButton): A button to confirm the selection.
         discard_button (QPushButton): A button to discard the selection.
+        desktop (QPixmap): A snapshot of the screen taken when shown.
+        dimmed_desktop (QPixmap): The same snapshot, dimmed.
     Methods:
         `mousePressEvent(event)`:
             Handles mouse press events to start the selection.
@@ -851,6 +924,8 @@ class ScreenDimensionSelector(QWidget):
             Handles mouse release events to complete the selection.
         `paintEvent(event)`:
             Handles paint events to draw the selection rectangle.
+        `showEvent(event)`:
+            Handles show events to take a snapshot of the screen.
         `keyPressEvent(event)`:
             Handles key press events to close the widget on pressing the
             Escape key.
@@ -868,8 +943,7 @@ class ScreenDimensionSelector(QWidget):
         """
         Initializes the main window for the Jhagmag LED Controller application.
         This method sets up the main window with the following properties:
-        - Frameless window with 90% opacity.
-        - Translucent background.
+        - Frameless, opaque window painted from a snapshot of the screen.
         - Fullscreen mode.
         - Mouse tracking enabled.
         - Initializes start and end positions for selection.
@@ -885,20 +959,25 @@ class ScreenDimensionSelector(QWidget):
                 called when selection is complete.
             confirm_button (QPushButton): Button to confirm the selection.
             discard_button (QPushButton): Button to discard the selection.
+            desktop (QPixmap or None): Snapshot of the screen.
+            dimmed_desktop (QPixmap or None): Dimmed snapshot of the screen.
         """
 
         super().__init__()
         self.setWindowFlags(
             Qt.WindowType.Window | Qt.WindowType.FramelessWindowHint
         )
-        self.setWindowOpacity(0.9)  # Adjust opacity for better visibility
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Every pixel is painted from the screen snapshot, so the window is
+        # opaque and the compositor never has to blend it
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.setWindowState(Qt.WindowState.WindowFullScreen)
         self.start_pos = None
         self.end_pos = None
         self.selection_complete_flag = False
         self.setMouseTracking(True)
         self.selection_complete_callback = None
+        self.desktop = None
+        self.dimmed_desktop = None
 
         # Add confirm and discard buttons
         self.confirm_button = QPushButton("✔", self)
@@ -935,8 +1014,11 @@ class ScreenDimensionSelector(QWidget):
         Handle mouse move events.
 
         This method is called whenever the mouse is moved within the widget.
-        It updates the end position of the selection and triggers a repaint
-        if the selection is not yet complete.
+        It updates the end position of the selection and, if the selection is
+        not yet complete, repaints only the area covered by the previous and
+        the new selection rectangles instead of the whole fullscreen widget.
+        Nothing is repainted before a selection has been started, or when the
+        pointer moved by less than 2 pixels since the last update.
 
         Args:
             event (QMouseEvent): The mouse event containing information about
@@ -944,8 +1026,21 @@ class ScreenDimensionSelector(QWidget):
         """
 
         if not self.selection_complete_flag:
-            self.end_pos = event.pos()
-            self.update()
+            previous_end = self.end_pos
+            pos = event.pos()
+            # Ignore jitter of less than 2 pixels
+            if (previous_end is not None
+                    and (pos - previous_end).manhattanLength() < 2):
+                return
+            self.end_pos = pos
+            if self.start_pos is None or previous_end is None:
+                return
+
+            dirty = QRect.span(self.start_pos, previous_end).united(
+                QRect.span(self.start_pos, self.end_pos)
+            )
+            # Grow by the pen width so the old border is fully erased
+            self.update(dirty.adjusted(-2, -2, 2, 2))
 
     def mouseReleaseEvent(self, event):
 
@@ -954,8 +1049,8 @@ class ScreenDimensionSelector(QWidget):
 
         This method is triggered when the mouse button is released. It marks
         the end position of the selection, sets the selection complete flag,
-        updates the display, and positions the confirm and discard buttons
-        near the selection area.
+        turns off mouse tracking, updates the display, and positions the
+        confirm and discard buttons near the selection area.
 
         Args:
             event (QMouseEvent): The mouse event containing the position where
@@ -965,6 +1060,8 @@ class ScreenDimensionSelector(QWidget):
         if not self.selection_complete_flag:
             self.end_pos = event.pos()
             self.selection_complete_flag = True
+            # Stop receiving hover moves until the selection is discarded
+            self.setMouseTracking(False)
             self.update()
             self.confirm_button.move(
                 self.end_pos.x() - 50, self.end_pos.y() + 10
@@ -975,27 +1072,53 @@ class ScreenDimensionSelector(QWidget):
             self.confirm_button.show()
             self.discard_button.show()
 
+    def showEvent(self, event):
+
+        """
+        Handle show events to take a snapshot of the screen.
+
+        The screen is grabbed once, right before the widget appears, and a
+        dimmed copy of it is prepared. Every later repaint is a plain blit of
+        these pixmaps.
+
+        Args:
+            event (QShowEvent): The show event that triggers this method.
+        """
+
+        screen = self.screen() or QApplication.primaryScreen()
+        self.desktop = screen.grabWindow(0)
+        self.dimmed_desktop = QPixmap(self.desktop)
+        painter = QPainter(self.dimmed_desktop)
+        painter.fillRect(self.dimmed_desktop.rect(), QColor(0, 0, 0, 50))
+        painter.end()
+        super().showEvent(event)
+
     def paintEvent(self, event):
 
         """
         Handle paint events to draw on the widget.
         This method is called whenever the widget needs to be repainted.
-        It uses QPainter to draw a semi-transparent background and, if start
-        and end positions are defined, it draws a rectangle from start_pos to
-        end_pos.
+        It draws the dimmed snapshot of the screen, then the undimmed
+        snapshot inside the rectangle from start_pos to end_pos and a red
+        border around it, if both are defined.
         Args:
             event (QPaintEvent): The paint event that triggers this method.
         """
 
+        if self.dimmed_desktop is None:
+            return
         painter = QPainter(self)
-        painter.setPen(QPen(Qt.GlobalColor.red, 2, Qt.PenStyle.SolidLine))
-        painter.setBrush(QBrush(QColor(0, 0, 0, 50)))
-        painter.drawRect(self.rect())  # Draw the semi-transparent background
+        painter.drawPixmap(0, 0, self.dimmed_desktop)
 
         if self.start_pos and self.end_pos:
-            rect = QRect(self.start_pos, self.end_pos)
+            selection = QRect.span(self.start_pos, self.end_pos)
+            painter.save()
+            painter.setClipRect(selection)
+            painter.drawPixmap(0, 0, self.desktop)
+            painter.restore()
+            painter.setPen(QPen(Qt.GlobalColor.red, 2, Qt.PenStyle.SolidLine))
             painter.setBrush(QBrush(Qt.GlobalColor.transparent))
-            painter.drawRect(rect)
+            painter.drawRect(QRect(self.start_pos, self.end_pos))
 
     def keyPressEvent(self, event):
 
@@ -1029,13 +1152,14 @@ class ScreenDimensionSelector(QWidget):
 
         """
         Discard the current selection by resetting the start and end positions,
-        marking the selection as incomplete, updating the display, and hiding
-        the confirm and discard buttons.
+        marking the selection as incomplete, turning mouse tracking back on,
+        updating the display, and hiding the confirm and discard buttons.
         """
 
         self.start_pos = None
         self.end_pos = None
         self.selection_complete_flag = False
+        self.setMouseTracking(True)
         self.update()
         self.confirm_button.hide()
         self.discard_button.hide()
@@ -1045,9 +1169,10 @@ class ScreenDimensionSelector(QWidget):
         """
         Complete the selection process by determining the rectangular area
         defined by the start and end positions. If both positions are set,
-        it calculates the top-left and bottom-right coordinates of the
-        rectangle and invokes the selection complete callback with these
-        coordinates.
+        it builds the rectangle spanning them with `QRect.span`, which
+        orders the corners and includes both points whatever the drag
+        direction, and invokes the selection complete callback with its
+        top-left and bottom-right coordinates.
 
         The callback function is called with the following parameters:
         - x1: The minimum x-coordinate of the selection rectangle.
@@ -1056,13 +1181,10 @@ class ScreenDimensionSelector(QWidget):
         - y2: The maximum y-coordinate of the selection rectangle.
         """
 
-        if self.start_pos and self.end_pos:
-            x1, y1 = self.start_pos.x(), self.start_pos.y()
-            x2, y2 = self.end_pos.x(), self.end_pos.y()
-            x1, x2 = min(x1, x2), max(x1, x2)
-            y1, y2 = min(y1, y2), max(y1, y2)
-            if self.selection_complete_callback:
-                self.selection_complete_callback(x1, y1, x2, y2)
+        callback = self.selection_complete_callback
+        if self.start_pos and self.end_pos and callback:
+            rect = QRect.span(self.start_pos, self.end_pos)
+            callback(rect.left(), rect.top(), rect.right(), rect.bottom())
 
 
 def load_stylesheet(app, file_path):
@@ -1070,17 +1192,28 @@ def load_stylesheet(app, file_path):
     """
     Loads a stylesheet from a file and applies it to the given application.
 
+    The file is read through QFile and QTextStream, so the text stays on the
+    Qt side and the path may also name a Qt resource (":/...").
+
     Args:
         app: The application instance to which the stylesheet will be applied.
         file_path (str): The path to the stylesheet file.
 
     Raises:
-        FileNotFoundError: If the specified file does not exist.
-        IOError: If there is an error reading the file.
+        FileNotFoundError: If the specified file cannot be opened.
     """
 
-    with open(file_path, "r") as f:
-        app.setStyleSheet(f.read())
+    file = QFile(file_path)
+    if not file.open(
+        QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text
+    ):
+        raise FileNotFoundError(
+            f"Cannot open stylesheet {file_path}: {file.errorString()}"
+        )
+    try:
+        app.setStyleSheet(QTextStream(file).readAll())
+    finally:
+        file.close()
 
 
 # Main Application Execution
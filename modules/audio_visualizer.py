@@ -1,10 +1,69 @@
 import numpy as np
 import pyaudio
-import librosa
-import matplotlib.animation as animation
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+import time
+
+try:
+    import pyfftw  # FFTW bindings, planned and SIMD-aligned transforms
+except ImportError:
+    pyfftw = None
+
+try:
+    from numba import njit  # Compiles process_levels to native code
+except ImportError:
+    njit = None
+
+
+def process_levels(levels, current_levels, max_levels, gate, decay,
+                   compression):
+
+    """
+    Apply the noise gate, decay, normalization and compression to the band
+    levels in a single pass.
+
+    With only three bands, the cost of this step is dominated by per-call
+    overhead rather than arithmetic, so it is written as a plain loop that
+    numba compiles to native code when it is installed. Without numba it
+    runs as ordinary Python.
+
+    Parameters:
+    levels (numpy.ndarray): The bass, mid and treble levels of the chunk.
+    current_levels (numpy.ndarray): The current levels, updated in place.
+    max_levels (numpy.ndarray): The maximum observed levels, updated in
+        place.
+    gate (float): The noise gate threshold.
+    decay (float): The decay applied to gated levels.
+    compression (numpy.ndarray): The compression gain of each band.
+
+    Returns:
+    tuple: The normalized and the compressed levels as numpy.ndarrays.
+    """
+
+    normalized = np.empty(3, dtype=np.float32)
+    compressed = np.empty(3, dtype=np.float32)
+    for i in range(3):
+        # Update the level only if it exceeds the noise gate threshold,
+        # otherwise let it decay
+        if levels[i] > gate:
+            current_levels[i] = levels[i]
+            if levels[i] > max_levels[i]:
+                max_levels[i] = levels[i]
+        else:
+            current_levels[i] = max(current_levels[i] - decay, 0.0)
+        # Normalize relative to the maximum, then compress
+        normalized[i] = current_levels[i] / max_levels[i]
+        compressed[i] = min(normalized[i] * compression[i], 1.0)
+    return normalized, compressed
+
+
+if njit is not None:
+    process_levels = njit(cache=True)(process_levels)
+    # Compile for the argument types of process_chunk at import, rather than
+    # in the first audio callback, which would overflow the stream
+    process_levels(
+        np.zeros(3, dtype=np.float32), np.zeros(3, dtype=np.float32),
+        np.ones(3, dtype=np.float32), 0.0, 0.0,
+        np.ones(3, dtype=np.float32)
+    )
 
 
 class AudioVisualizer:
@@ -19,31 +78,62 @@ class AudioVisualizer:
         RATE (int): The sampling rate of the audio stream.
         CHANNELS (int): The number of audio channels.
         FORMAT (int): The format of the audio stream.
+        n_fft (int): The number of FFT points.
+        bass_bins (slice): The FFT bins of the bass band.
+        mid_bins (slice): The FFT bins of the mid band.
+        treble_bins (slice): The FFT bins of the treble band.
+        window (numpy.ndarray): The Hann window applied to each chunk.
         audio (pyaudio.PyAudio): The PyAudio instance.
         stream (pyaudio.Stream): The audio input stream.
-        fig (matplotlib.figure.Figure): The Matplotlib figure for plotting.
+        windowed (numpy.ndarray): The windowed copy of the chunk that is
+            transformed.
+        fft (pyfftw.FFTW or None): The planned FFT of `windowed`, or None if
+            pyFFTW is not installed.
+        fft_out (numpy.ndarray or None): The output buffer of `fft`.
+        fig (matplotlib.figure.Figure): The Matplotlib figure for plotting,
+            with Tkinter.
         ax (matplotlib.axes.Axes): The axes of the Matplotlib figure.
         bars (matplotlib.container.BarContainer): The bar container for the
             frequency bands.
-        current_bass (float): The current bass level.
-        current_mid (float): The current mid level.
-        current_treble (float): The current treble level.
-        max_bass (float): The maximum observed bass level.
-        max_mid (float): The maximum observed mid level.
-        max_treble (float): The maximum observed treble level.
+        bands_widget (BandsWidget or None): The widget drawing the frequency
+            bands, with PyQt.
+        timer: The timer driving `update`.
+        current_levels (numpy.ndarray): The current bass, mid and treble
+            levels.
+        max_levels (numpy.ndarray): The maximum observed bass, mid and treble
+            levels.
+        COMPRESSION (numpy.ndarray): The dynamic range compression gain of
+            each band.
+        RGB_GAIN (numpy.ndarray): The gain of each band when mapped to a
+            color channel.
         FADE_THRESHOLD (float): The threshold for fading the LED colors.
         NOISE_GATE_THRESHOLD (float): The threshold for ignoring noise.
         DECAY_TIME (float): The time for the audio levels to decay.
+        decay_rate (float): The level decay applied per chunk.
+        latest_levels (numpy.ndarray): The latest normalized levels, drawn by
+            `update`.
+        COLOR_THRESHOLD (int): The smallest channel change worth sending.
+        RESEND_INTERVAL (float): The time after which the color is sent even
+            if it barely changed.
+        last_rgb (tuple): The last color sent via serial.
+        last_send_time (float): The time the last color was sent.
     Methods:
         `get_canvas()`:
             Returns the canvas widget for embedding in a GUI.
         `get_frequency_indices(freq_range, n_fft, rate)`:
-            Returns the indices of the frequencies within the specified range.
+            Returns the slice of FFT bins within the specified range.
         `nextpow2(n)`:
             Returns the next power of 2 greater than or equal to n.
-        `update(frame)`:
-            Updates the audio visualization and sends RGB values via serial.
-        `audio_to_rgb(bass_level, mid_level, treble_level)`:
+        `audio_callback(in_data, frame_count, time_info, status)`:
+            Windows and processes each chunk delivered by the stream.
+        `rfft()`:
+            Returns the real FFT of the windowed chunk.
+        `process_chunk()`:
+            Computes the band levels of a chunk and sends RGB values via
+            serial.
+        `update(frame=None)`:
+            Draws the latest band levels.
+        `audio_to_rgb(levels)`:
             Converts audio levels to RGB values.
         `start()`:
             Starts the audio visualizer.
@@ -59,8 +149,8 @@ class AudioVisualizer:
         Initializes the AudioVisualizer class.
 
         Parameters:
-            master (Tk or QWidget): Parent widget for embedding the matplotlib
-                figure.
+            master (Tk or QLayout): Parent widget, or layout, for embedding
+                the visualization.
             serial_conn (serial.Serial): Serial connection object.
             chunk (int, optional): Frames per buffer. Default is 1024.
             rate (int, optional): Sampling rate. Default is 44100.
@@ -74,25 +164,44 @@ class AudioVisualizer:
             RATE (int): Sampling rate.
             CHANNELS (int): Number of audio channels.
             FORMAT (int): Audio stream format.
+            n_fft (int): Number of FFT points.
+            bass_bins (slice): FFT bins of the bass band (20-250 Hz).
+            mid_bins (slice): FFT bins of the mid band (250-4000 Hz).
+            treble_bins (slice): FFT bins of the treble band (4-20 kHz).
+            window (numpy.ndarray): Periodic Hann window of length CHUNK.
             audio (pyaudio.PyAudio): PyAudio instance.
             stream (pyaudio.Stream): Audio input stream.
-            fig (matplotlib.figure.Figure): Matplotlib figure.
-            ax (matplotlib.axes._subplots.AxesSubplot): Matplotlib axes.
-            bars (matplotlib.container.BarContainer): Bar container for audio
+            windowed (numpy.ndarray): Scratch buffer for the windowed chunk.
+            fft (pyfftw.FFTW or None): FFTW plan transforming `windowed`.
+            fft_out (numpy.ndarray or None): Output buffer of `fft`.
+            current_levels (numpy.ndarray): Current bass, mid and treble
                 levels.
-            current_bass (float): Current bass level.
-            current_mid (float): Current mid level.
-            current_treble (float): Current treble level.
-            max_bass (float): Maximum bass level.
-            max_mid (float): Maximum mid level.
-            max_treble (float): Maximum treble level.
+            max_levels (numpy.ndarray): Maximum bass, mid and treble levels.
+            COMPRESSION (numpy.ndarray): Compression gain of each band.
+            RGB_GAIN (numpy.ndarray): Color channel gain of each band.
             FADE_THRESHOLD (float): Threshold for fading effect.
             NOISE_GATE_THRESHOLD (float): Threshold for noise gate.
             DECAY_TIME (float): Decay time for audio levels.
-            canvas (FigureCanvasTkAgg or FigureCanvasQTAgg): Canvas for
-                embedding the matplotlib figure.
+            decay_rate (float): Decay applied to the levels per chunk.
+            latest_levels (numpy.ndarray): Latest normalized levels.
+            COLOR_THRESHOLD (int): Smallest channel change worth sending.
+            RESEND_INTERVAL (float): Seconds after which the color is sent
+                even if it barely changed.
+            last_rgb (tuple): Last color sent via serial.
+            last_send_time (float): Monotonic time of the last send.
+            fig (matplotlib.figure.Figure): Matplotlib figure (Tk only).
+            ax (matplotlib.axes._subplots.AxesSubplot): Matplotlib axes (Tk
+                only).
+            bars (matplotlib.container.BarContainer): Bar container for audio
+                levels (Tk only).
             ani (matplotlib.animation.FuncAnimation): Animation object for
-                updating the plot.
+                updating the plot (Tk only).
+            bands_widget (BandsWidget or None): Native Qt widget drawing the
+                levels (Qt only).
+            canvas (FigureCanvasTkAgg or BandsWidget): Widget embedded in the
+                GUI.
+            timer (matplotlib TimerBase or QTimer): Timer calling `update`
+                every 50 ms while the visualizer runs.
         """
 
         # Serial connection
@@ -105,67 +214,135 @@ class AudioVisualizer:
         self.CHANNELS = 1
         self.FORMAT = pyaudio.paFloat32
 
-        # Initialize PyAudio
+        # CHUNK and RATE never change, so the FFT bins of each band are
+        # resolved once. The bins of a frequency range are contiguous, so
+        # they are kept as slices rather than index arrays.
+        self.n_fft = self.nextpow2(self.CHUNK)
+        bands = ([20, 250], [250, 4000], [4000, 20000])
+        self.bass_bins, self.mid_bins, self.treble_bins = [
+            self.get_frequency_indices(band, self.n_fft, self.RATE)
+            for band in bands
+        ]
+
+        # Periodic Hann window, the same one librosa.stft applies by default
+        self.window = np.hanning(self.CHUNK + 1)[:-1].astype(np.float32)
+
+        # Buffer the stream callback windows each chunk into, allocated once
+        # and reused for every chunk
+        self.windowed = np.empty(self.CHUNK, dtype=np.float32)
+
+        # With pyFFTW, plan the transform once over aligned buffers. The
+        # chunk is windowed straight into the zero-padded input of the plan.
+        self.fft = None
+        self.fft_out = None
+        if pyfftw is not None:
+            fft_in = pyfftw.empty_aligned(self.n_fft, dtype='float32')
+            self.fft_out = pyfftw.empty_aligned(
+                self.n_fft // 2 + 1, dtype='complex64'
+            )
+            # Measuring overwrites the buffers, so plan before zeroing them
+            self.fft = pyfftw.FFTW(
+                fft_in, self.fft_out, flags=('FFTW_MEASURE',), threads=1
+            )
+            fft_in[:] = 0
+            self.windowed = fft_in[:self.CHUNK]
+
+        # Initialize PyAudio in callback mode, so chunks are delivered on
+        # PortAudio's own thread and the animation tick never blocks on them.
+        # The stream is started by `start`.
         self.audio = pyaudio.PyAudio()
         self.stream = self.audio.open(
             format=self.FORMAT,
             channels=self.CHANNELS,
             rate=self.RATE,
             input=True,
-            frames_per_buffer=self.CHUNK
+            frames_per_buffer=self.CHUNK,
+            stream_callback=self.audio_callback,
+            start=False
         )
 
-        # Matplotlib figure for embedding in GUI
-        self.fig, self.ax = plt.subplots(figsize=(480/100, 280/100), dpi=100)
-        self.fig.patch.set_facecolor('#2c2f33')  # Figure background color
-        self.ax.set_facecolor('#2c2f33')  # Axis background color
-        self.fig.patch.set_linewidth(2)
-
-        self.ax.spines['right'].set_color('#2c2f33')  # Right border (spine)
-        self.ax.spines['bottom'].set_color('#2c2f33')  # Bottom border (spine)
-        self.ax.spines['left'].set_color('#2c2f33')  # Left border (spine)
-        self.ax.spines['top'].set_color('#2c2f33')  # Top border (spine)
-
-        # Set axis labels color to white
-        self.ax.tick_params(axis='both', colors='#ffffff')  # Axis ticks color
-        self.ax.xaxis.label.set_color('#ffffff')  # X axis label color
-        self.ax.yaxis.label.set_color('#ffffff')  # Y axis label color
-
-        # Set title color to white
-        self.ax.set_title('Audio Reactive Plot', color='#ffffff')
-        self.bars = self.ax.barh(
-            ['Bass', 'Mid', 'Treble'],
-            [0, 0, 0],
-            color=['#ff4c4c', '#4caf50', '#42aaff'],
-            edgecolor='none',
-            height=0.5,
-            linewidth=0,
-            capsize=20
-        )
-        self.ax.set_xlim(0, 1)
-
-        # Other variables
-        self.current_bass = 0
-        self.current_mid = 0
-        self.current_treble = 0
-        self.max_bass = 1
-        self.max_mid = 1
-        self.max_treble = 1
+        # Other variables, bands are ordered bass, mid, treble
+        self.current_levels = np.zeros(3, dtype=np.float32)
+        self.max_levels = np.ones(3, dtype=np.float32)
+        self.latest_levels = np.zeros(3, dtype=np.float32)
+        self.COMPRESSION = np.array([1.0, 1.2, 1.5], dtype=np.float32)
+        self.RGB_GAIN = np.array([1.2, 1.0, 1.0], dtype=np.float32)
         self.FADE_THRESHOLD = 0.05
-        self.NOISE_GATE_THRESHOLD = 0.02
+        # RMS band levels of noise run about sqrt(4 / pi) = 1.13 times the
+        # mean bin magnitude the gate was tuned on, so it is scaled to match
+        self.NOISE_GATE_THRESHOLD = 0.0226
         self.DECAY_TIME = 1
 
+        # Calculate the decay rate per chunk based on the desired decay time
+        self.decay_rate = 1 - (1 / (self.RATE * self.DECAY_TIME))
+
+        # Only send colors that visibly changed, or periodically refresh the
+        # current one, so steady audio does not flood the serial port
+        self.COLOR_THRESHOLD = 4
+        self.RESEND_INTERVAL = 0.1
+        self.last_rgb = (-1, -1, -1)
+        self.last_send_time = 0.0
+
+        # Only the toolkit in use is imported, so neither backend loads the
+        # other's native libraries
         if type == 'tk':
+            import matplotlib.animation as animation
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            # Matplotlib figure for embedding in GUI
+            self.fig, self.ax = plt.subplots(
+                figsize=(480/100, 280/100), dpi=100
+            )
+            self.fig.patch.set_facecolor('#2c2f33')  # Figure background
+            self.ax.set_facecolor('#2c2f33')  # Axis background color
+            self.fig.patch.set_linewidth(2)
+
+            # Hide the borders (spines)
+            for spine in ('right', 'bottom', 'left', 'top'):
+                self.ax.spines[spine].set_color('#2c2f33')
+
+            # Set axis labels color to white
+            self.ax.tick_params(axis='both', colors='#ffffff')  # Ticks color
+            self.ax.xaxis.label.set_color('#ffffff')  # X axis label color
+            self.ax.yaxis.label.set_color('#ffffff')  # Y axis label color
+
+            # Set title color to white
+            self.ax.set_title('Audio Reactive Plot', color='#ffffff')
+            self.bars = self.ax.barh(
+                ['Bass', 'Mid', 'Treble'],
+                [0, 0, 0],
+                color=['#ff4c4c', '#4caf50', '#42aaff'],
+                edgecolor='none',
+                height=0.5,
+                linewidth=0,
+                capsize=20
+            )
+            self.ax.set_xlim(0, 1)
+
+            self.bands_widget = None
             self.canvas = FigureCanvasTkAgg(self.fig, master)
             self.canvas.get_tk_widget().pack()
+
+            # Animation setup, blitting only the bars over the cached
+            # background
+            self.ani = animation.FuncAnimation(
+                self.fig, self.update, interval=50, blit=True,
+                cache_frame_data=False
+            )
+            self.timer = self.ani.event_source
         else:
-            self.canvas = FigureCanvasQTAgg(self.fig)
+            # Qt draws the bars natively, without Matplotlib
+            from PyQt6.QtCore import QTimer
+            from .bands_widget import BandsWidget
+
+            self.bands_widget = BandsWidget()
+            self.canvas = self.bands_widget
             master.addWidget(self.canvas)
 
-        # Animation setup
-        self.ani = animation.FuncAnimation(
-            self.fig, self.update, interval=50, cache_frame_data=False
-        )
+            self.timer = QTimer(self.bands_widget)
+            self.timer.setInterval(50)
+            self.timer.timeout.connect(self.update)
 
     def get_canvas(self):
 
@@ -181,8 +358,11 @@ class AudioVisualizer:
     def get_frequency_indices(self, freq_range, n_fft, rate):
 
         """
-        Get the indices of the frequency bins that fall within a specified
-        frequency range.
+        Get the frequency bins that fall within a specified frequency range.
+
+        Bin `k` of a real FFT is centred on `k * rate / n_fft` Hz, so the
+        bins of a range are found in closed form instead of by scanning the
+        full list of bin frequencies.
 
         Parameters:
         freq_range (tuple): A tuple containing the lower and upper bounds of
@@ -191,11 +371,13 @@ class AudioVisualizer:
         rate (float): The sampling rate of the audio signal (in Hz).
 
         Returns:
-        numpy.ndarray: An array of indices corresponding to the frequency bins
-            within the specified range.
+        slice: The contiguous slice of frequency bins within the specified
+            range, usable as a view into the spectrum.
         """
-        freqs = np.fft.rfftfreq(n_fft, 1.0 / rate)
-        return np.where((freqs >= freq_range[0]) & (freqs <= freq_range[1]))[0]
+
+        low = int(np.ceil(freq_range[0] * n_fft / rate))
+        high = min(int(np.floor(freq_range[1] * n_fft / rate)), n_fft // 2)
+        return slice(low, high + 1)
 
     def nextpow2(self, n):
 
@@ -212,128 +394,142 @@ class AudioVisualizer:
 
         return 2 ** int(np.ceil(np.log2(n)))
 
-    def update(self, frame):
+    def audio_callback(self, in_data, frame_count, time_info, status):
 
         """
-        Update the audio visualizer with the latest audio frame.
-        This method processes the audio data from the stream, computes the
-        Short-Time Fourier Transform (STFT), and updates the visualizer's
-        levels for bass, mid, and treble frequencies. It also applies a noise
-        gate, decay, normalization, and dynamic range compression before
-        sending the RGB values via serial communication and updating the
-        visual representation.
+        Process each chunk delivered by the stream.
+
+        PyAudio calls this method on its own thread whenever a chunk has been
+        recorded, so every chunk is analysed, at the pace of the audio, and
+        none of the work runs on the GUI thread. The chunk is windowed
+        straight from the recorded bytes into the preallocated scratch
+        buffer and handed to `process_chunk`.
+
         Parameters:
-            frame (int): The current frame number (not used in the method but
-                required by the animation function).
+        in_data (bytes): The recorded float32 samples.
+        frame_count (int): The number of frames in `in_data`, always CHUNK.
+        time_info (dict): Timing information from PortAudio (unused).
+        status (int): PortAudio status flags (unused).
+
         Returns:
-            None
+        tuple: No output data and `pyaudio.paContinue` to keep recording.
         """
 
-        data = np.frombuffer(
-            self.stream.read(self.CHUNK, exception_on_overflow=False),
-            dtype=np.float32
-        )
+        samples = np.frombuffer(in_data, dtype=np.float32, count=self.CHUNK)
+        np.multiply(samples, self.window, out=self.windowed)
+        self.process_chunk()
+        return None, pyaudio.paContinue
 
-        # Compute the STFT for the chunk, setting n_fft equal to CHUNK
-        stft = np.abs(librosa.stft(
-            data,
-            n_fft=self.nextpow2(self.CHUNK),
-            hop_length=self.CHUNK,
-            center=False
-        ))
+    def rfft(self):
 
-        bass_idx = self.get_frequency_indices(
-            [20, 250], self.CHUNK, self.RATE
-        )
-        mid_idx = self.get_frequency_indices(
-            [250, 4000], self.CHUNK, self.RATE
-        )
-        treble_idx = self.get_frequency_indices(
-            [4000, 20000], self.CHUNK, self.RATE
-        )
+        """
+        Compute the real FFT of the windowed chunk.
 
-        # Compute average amplitude for each frequency band
-        bass_level = np.mean(stft[bass_idx])
-        mid_level = np.mean(stft[mid_idx])
-        treble_level = np.mean(stft[treble_idx])
+        If pyFFTW is installed, the pre-planned transform is run in place
+        over its aligned buffers; otherwise NumPy's `rfft` is used.
 
-        # Calculate the decay rate per frame based on the desired decay time
-        decay_rate = 1 - (1 / (self.RATE * self.DECAY_TIME))
+        Returns:
+        numpy.ndarray: The complex spectrum, with `n_fft // 2 + 1` bins.
+        """
 
-        # Update the levels only if they exceed the noise gate threshold
-        if bass_level > self.NOISE_GATE_THRESHOLD:
-            self.current_bass = bass_level
-            self.max_bass = max(self.max_bass, bass_level)
-        else:
-            self.current_bass = max(self.current_bass - decay_rate, 0)
+        if self.fft is not None:
+            return self.fft()
+        return np.fft.rfft(self.windowed, n=self.n_fft)
 
-        if mid_level > self.NOISE_GATE_THRESHOLD:
-            self.current_mid = mid_level
-            self.max_mid = max(self.max_mid, mid_level)
-        else:
-            self.current_mid = max(self.current_mid - decay_rate, 0)
+    def process_chunk(self):
 
-        if treble_level > self.NOISE_GATE_THRESHOLD:
-            self.current_treble = treble_level
-            self.max_treble = max(self.max_treble, treble_level)
-        else:
-            self.current_treble = max(self.current_treble - decay_rate, 0)
-
-        # Normalize the levels relative to their maximum observed values
-        normalized_bass = self.current_bass / self.max_bass
-        normalized_mid = self.current_mid / self.max_mid
-        normalized_treble = self.current_treble / self.max_treble
-
-        # Apply dynamic range compression for mid and treble
-        compressed_mid = min(normalized_mid * 1.2, 1.0)
-        compressed_treble = min(normalized_treble * 1.5, 1.0)
-
-        # Send RGB values via serial only if above the threshold
-        if (
-            normalized_bass > self.FADE_THRESHOLD or
-            compressed_mid > self.FADE_THRESHOLD or
-            compressed_treble > self.FADE_THRESHOLD
-        ):
-            red, green, blue = self.audio_to_rgb(
-                normalized_bass, compressed_mid, compressed_treble
-            )
-            self.serial_conn.send_color(red, green, blue)
+        """
+        Analyse the windowed chunk and drive the LEDs.
+        This method computes the power spectrum of the Hann-windowed chunk
+        with a single real FFT and updates the visualizer's levels for bass,
+        mid, and treble frequencies from the RMS amplitude of each band. It
+        also applies a noise gate, decay, normalization, and dynamic range
+        compression before sending the RGB values via serial communication.
+        The normalized levels are published in `latest_levels` for `update`
+        to draw.
+        """
+
+        # Compute the power spectrum, which needs no square root per bin
+        spectrum = self.rfft()
+        power = spectrum.real * spectrum.real + spectrum.imag * spectrum.imag
+
+        # Compute the RMS amplitude of each frequency band, taking the square
+        # root of the three band averages only
+        levels = np.sqrt(np.array([
+            power[self.bass_bins].mean(),
+            power[self.mid_bins].mean(),
+            power[self.treble_bins].mean()
+        ], dtype=np.float32))
+
+        # Gate, decay, normalize relative to the maximum observed values and
+        # compress the mid and treble, all in one compiled pass
+        normalized, compressed = process_levels(
+            levels, self.current_levels, self.max_levels,
+            self.NOISE_GATE_THRESHOLD, self.decay_rate, self.COMPRESSION
+        )
+        # A fresh array every chunk, so publishing it is a reference swap
+        self.latest_levels = normalized
+
+        # Send RGB values via serial only if above the threshold and if the
+        # color changed noticeably or has not been sent for a while
+        if (compressed > self.FADE_THRESHOLD).any():
+            rgb = self.audio_to_rgb(compressed)
+            now = time.monotonic()
+            change = max(abs(c - last) for c, last in zip(rgb, self.last_rgb))
+            if (change > self.COLOR_THRESHOLD
+                    or now - self.last_send_time > self.RESEND_INTERVAL):
+                self.serial_conn.send_color(*rgb)
+                self.last_rgb = rgb
+                self.last_send_time = now
+
+    def update(self, frame=None):
+
+        """
+        Update the visual representation with the latest audio levels.
+        This method only draws `latest_levels`, published by `process_chunk`
+        on the audio thread, so the timer tick never waits on the stream or
+        the FFT.
+        Parameters:
+            frame (int, optional): The current frame number (not used in the
+                method but passed by the Matplotlib animation).
+        Returns:
+            tuple: The bar artists that changed, so that the animation only
+                blits them over the cached axes instead of redrawing the
+                whole figure. Empty with PyQt, where `bands_widget` repaints
+                itself.
+        """
+
+        normalized = self.latest_levels
+        if self.bands_widget is not None:
+            self.bands_widget.set_levels(normalized)
+            return ()
 
         # Update bar widths in the plot instead of heights
-        self.bars[0].set_width(normalized_bass)
-        self.bars[1].set_width(normalized_mid)
-        self.bars[2].set_width(normalized_treble)
-        self.canvas.draw()
+        for bar, level in zip(self.bars, normalized):
+            bar.set_width(level)
+        return tuple(self.bars)
 
-    def audio_to_rgb(self, bass_level, mid_level, treble_level):
+    def audio_to_rgb(self, levels):
 
         """
         Converts audio levels to RGB values.
-        This function takes in bass, mid, and treble audio levels and converts
-        them to corresponding RGB values. The conversion is done by mapping
-        the audio levels to the RGB color space.
+        This function takes in the bass, mid, and treble audio levels and
+        converts them to the corresponding red, green and blue values in a
+        single vectorized expression. Levels at or below 0.05 turn their
+        channel off; the others are mapped linearly from 25 to 255, with the
+        bass boosted by `RGB_GAIN`.
         Args:
-            bass_level (float): The bass level of the audio, expected to be
-                between 0 and 1.
-            mid_level (float): The mid level of the audio, expected to be
-                between 0 and 1.
-            treble_level (float): The treble level of the audio, expected to
-                be between 0 and 1.
+            levels (numpy.ndarray): The bass, mid and treble levels of the
+                audio, expected to be between 0 and 1.
         Returns:
             tuple: A tuple containing the RGB values (red, green, blue)
                 as integers ranging from 0 to 255.
         """
 
-        def amplitude_to_rgb(level, multiplier=1, min_rgb=25):
-            if level <= 0.05:
-                return 0
-            rgb_value = int(min_rgb + ((255 - min_rgb) * level * multiplier))
-            return max(0, min(255, rgb_value))
-
-        red = amplitude_to_rgb(bass_level, 1.2)
-        green = amplitude_to_rgb(mid_level)
-        blue = amplitude_to_rgb(treble_level)
-
+        values = np.where(
+            levels <= 0.05, 0.0, 25 + (255 - 25) * levels * self.RGB_GAIN
+        )
+        red, green, blue = np.clip(values, 0, 255).astype(np.int32).tolist()
         return red, green, blue
 
     def start(self):
@@ -342,12 +538,13 @@ class AudioVisualizer:
         Starts the audio visualizer.
 
         This method sets the running flag to True, resumes the animation,
-        and starts the audio stream if it is not already active.
+        and starts the audio stream if it is not already active, which starts
+        delivering chunks to `audio_callback`.
         """
 
         self.running = True
         # Resume the animation
-        self.ani.event_source.start()
+        self.timer.start()
         if not self.stream.is_active():
             self.stream.start_stream()
 
@@ -362,7 +559,7 @@ class AudioVisualizer:
 
         self.running = False
         # Pause the animation and the stream
-        self.ani.event_source.stop()
+        self.timer.stop()
         if self.stream.is_active():
             self.stream.stop_stream()
 
@@ -381,7 +578,6 @@ class AudioVisualizer:
 if __name__ == "__main__":
     import tkinter as tk
     from serial_connection import SerialConnection
-    import time
 
     # Create a Tkinter window
     root = tk.Tk()
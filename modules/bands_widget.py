@@ -0,0 +1,112 @@
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtWidgets import QWidget
+
+
+class BandsWidget(QWidget):
+
+    """
+    A lightweight widget drawing the bass, mid and treble levels of the audio
+    visualizer as three horizontal bars.
+    Attributes:
+        TITLE (str): The title drawn above the bars.
+        LABELS (tuple): The label of each band.
+        COLORS (tuple): The bar color of each band.
+        BACKGROUND (QColor): The background color.
+        levels (list): The bass, mid and treble levels, between 0 and 1.
+    Methods:
+        `sizeHint()` -> QSize:
+            Returns the preferred size of the widget.
+        `set_levels(levels)`:
+            Updates the levels and schedules a repaint.
+        `paintEvent(event)`:
+            Draws the title, labels and bars.
+    """
+
+    TITLE = "Audio Reactive Plot"
+    LABELS = ("Bass", "Mid", "Treble")
+    COLORS = (QColor("#ff4c4c"), QColor("#4caf50"), QColor("#42aaff"))
+    BACKGROUND = QColor("#2c2f33")
+
+    def __init__(self, parent=None):
+
+        """
+        Initializes the widget with all levels at zero.
+
+        Args:
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+
+        super().__init__(parent)
+        self.levels = [0.0, 0.0, 0.0]
+        # Every pixel is painted in paintEvent
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def sizeHint(self):
+
+        """
+        Returns the preferred size of the widget, matching the size of the
+        Matplotlib figure it replaces.
+
+        Returns:
+            QSize: The preferred size.
+        """
+
+        return QSize(480, 280)
+
+    def set_levels(self, levels):
+
+        """
+        Update the levels and schedule a repaint.
+
+        Args:
+            levels (iterable): The bass, mid and treble levels, between 0
+                and 1.
+        """
+
+        self.levels = [min(max(float(level), 0.0), 1.0) for level in levels]
+        self.update()
+
+    def paintEvent(self, event):
+
+        """
+        Draw the title, then one row per band with its label and a bar whose
+        length is proportional to its level. Only filled rectangles and text
+        are drawn, so a repaint costs a handful of QPainter calls.
+
+        Args:
+            event (QPaintEvent): The paint event that triggers this method.
+        """
+
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.BACKGROUND)
+        painter.setPen(Qt.GlobalColor.white)
+
+        title_height = 30
+        label_width = 60
+        margin = 10
+        painter.drawText(
+            QRect(0, 0, self.width(), title_height),
+            Qt.AlignmentFlag.AlignCenter, self.TITLE
+        )
+
+        row_height = (self.height() - title_height - margin) / 3
+        bar_height = int(row_height / 2)
+        bar_width = self.width() - label_width - 2 * margin
+        for row, (label, color, level) in enumerate(
+            zip(self.LABELS, self.COLORS, self.levels)
+        ):
+            # Bass is drawn at the bottom, like the original bar chart
+            top = int(title_height + (2 - row) * row_height)
+            painter.drawText(
+                QRect(margin, top, label_width - margin, int(row_height)),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                label
+            )
+            painter.fillRect(
+                label_width + margin,
+                top + (int(row_height) - bar_height) // 2,
+                int(bar_width * level),
+                bar_height,
+                color
+            )
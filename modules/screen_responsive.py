@@ -1,9 +1,160 @@
-from PIL import ImageGrab, ImageEnhance
+import mss
 import time
-from sklearn.cluster import KMeans
 import numpy as np
+import queue
 import threading
 
+try:
+    import dxcam  # DXGI Desktop Duplication, Windows only
+except ImportError:
+    dxcam = None
+
+try:
+    from numba import njit  # Compiles the pixel kernels to native code
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def mean_bgr(sample):
+
+        """
+        Average the sampled BGR pixels in a single compiled pass.
+
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels, possibly a strided view.
+
+        Returns:
+            tuple: The mean (blue, green, red) of the pixels.
+        """
+
+        blue = green = red = 0
+        for i in range(sample.shape[0]):
+            for j in range(sample.shape[1]):
+                blue += sample[i, j, 0]
+                green += sample[i, j, 1]
+                red += sample[i, j, 2]
+        count = max(sample.shape[0] * sample.shape[1], 1)
+        return blue / count, green / count, red / count
+
+    @njit(cache=True)
+    def mode_key(sample):
+
+        """
+        Find the most common 15-bit color key of the sampled BGR pixels with
+        a compiled counting loop. Ties go to the lowest key, as with the
+        `np.bincount` fallback, so both pick the same color.
+
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels, possibly a strided view.
+
+        Returns:
+            int: The key, packed as 5 bits each of red, green and blue.
+        """
+
+        counts = np.zeros(1 << 15, dtype=np.int32)
+        for i in range(sample.shape[0]):
+            for j in range(sample.shape[1]):
+                # Keys stay int64, since numba types the shifted uint8
+                # channels as unsigned and would index counts with a float
+                key = (
+                    (np.int64(sample[i, j, 2]) >> 3) << 10
+                    | (np.int64(sample[i, j, 1]) >> 3) << 5
+                    | (np.int64(sample[i, j, 0]) >> 3)
+                )
+                counts[key] += 1
+        return np.argmax(counts)
+
+    # Compile both kernels for the strided views they are given at import,
+    # rather than on the first frame, so a typing error surfaces at once
+    warmup = np.zeros((1, 1, 4), dtype=np.uint8)[:, :, :3]
+    mean_bgr(warmup)
+    mode_key(warmup)
+    del warmup
+else:
+    def mean_bgr(sample):
+
+        """
+        Average the sampled BGR pixels with a NumPy reduction.
+
+        The pixels are summed in a uint32 accumulator, which stays in integer
+        arithmetic instead of converting every pixel to float64 as `mean`
+        does. It holds samples of up to 2**32 // 255 pixels, about a
+        4096x4096 grid, far above the default `sample_size` but below a
+        full 8K frame. The strided view is reduced in place, since making it
+        contiguous would copy it.
+
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels, possibly a strided view.
+
+        Returns:
+            tuple: The mean (blue, green, red) of the pixels.
+        """
+
+        count = max(sample.shape[0] * sample.shape[1], 1)
+        blue, green, red = sample.sum(axis=(0, 1), dtype=np.uint32).tolist()
+        return blue / count, green / count, red / count
+
+    def mode_key(sample):
+
+        """
+        Find the most common 15-bit color key of the sampled BGR pixels with
+        `np.bincount`.
+
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels, possibly a strided view.
+
+        Returns:
+            int: The key, packed as 5 bits each of red, green and blue.
+        """
+
+        blue = (sample[..., 0] >> 3).astype(np.uint16)
+        green = (sample[..., 1] >> 3).astype(np.uint16)
+        red = (sample[..., 2] >> 3).astype(np.uint16)
+        keys = (red << 10) | (green << 5) | blue
+        return int(np.bincount(keys.ravel(), minlength=1 << 15).argmax())
+
+
+def lloyd(pixels, centers, iterations=4):
+
+    """
+    Refine color cluster centers with a fixed number of Lloyd iterations.
+
+    Each iteration assigns every pixel to its nearest center and moves each
+    center to the mean of its pixels. A center without pixels stays where
+    it is. Seeded with the centers of the previous frame, a few iterations
+    are enough on coherent screen content. Everything stays in float32: the
+    distances are expanded as |p|^2 - 2 p.c + |c|^2 so they come from one
+    matrix product, and the sums from a product with the one-hot labels.
+
+    Args:
+        pixels (numpy.ndarray): The (count, 3) float32 pixels.
+        centers (numpy.ndarray): The (clusters, 3) float32 starting centers.
+        iterations (int, optional): The number of iterations. Defaults to 4.
+
+    Returns:
+        tuple: The refined centers and the cluster index of each pixel.
+    """
+
+    clusters = len(centers)
+    indices = np.arange(clusters)
+    for _ in range(iterations):
+        # |p|^2 is the same for every center, so it is left out
+        distances = (centers * centers).sum(axis=1) - 2 * pixels @ centers.T
+        labels = distances.argmin(axis=1)
+        one_hot = (labels[:, None] == indices).astype(np.float32)
+        counts = one_hot.sum(axis=0)
+        sums = one_hot.T @ pixels
+        filled = counts > 0
+        centers = centers.copy()
+        centers[filled] = sums[filled] / counts[filled, None]
+    return centers, labels
+
 
 class ScreenResponsive:
 
@@ -15,16 +166,46 @@ class ScreenResponsive:
         running (bool): Indicates if the process is running.
         fps (int): Frames per second (default is 10).
         frame_interval (float): Time per frame in seconds.
+        frame_period_ns (int): Time per frame in nanoseconds.
         snapshot (tuple): Snapshot region (x, y, width, height).
+        region (dict or None): Snapshot region in the form taken by
+            `mss.grab`, or None for the primary screen.
+        SATURATION (float): Saturation boost applied to the dominant color.
+        sample_size (int): Number of pixels sampled along each axis.
+        METHODS (tuple): The supported ways of picking the dominant color.
+        method (str): How the dominant color is picked, "mean" for the
+            average color, "histogram" for the most common color or "kmeans"
+            for the center of the largest color cluster.
+        CLUSTERS (int): The number of color clusters of the "kmeans" method.
+        COHERENCE_THRESHOLD (float): Fraction of sampled pixels that must
+            change color before the "histogram" or "kmeans" dominant color
+            is computed again.
+        frames (queue.Queue): Single-slot queue handing the latest frame
+            from the capture thread to the color thread.
     Methods:
         `calculate_bounding_box()`:
             Calculates the bounding box for the active window.
+        `grab_frame()`:
+            Captures the screen or snapshot region as a BGRA array.
         `get_dominant_color()`:
-            Gets the dominant color of the screen or snapshot region using
-            KMeans clustering.
+            Gets the dominant color of the screen or snapshot region from
+            the sampled pixels.
+        `dominant_color(frame)`:
+            Gets the dominant color of a captured frame.
+        `histogram_color(sample)`:
+            Gets the most common color of the sampled pixels.
+        `kmeans_color(sample)`:
+            Gets the center of the largest color cluster of the sampled
+            pixels.
+        `coarse_histogram(sample)`:
+            Gets a coarse color histogram of the sampled pixels.
+        `enhance_color(color)`:
+            Boosts the saturation of a color.
+        `capture_loop()`:
+            Captures frames at the set FPS rate and hands them to `core`.
         `core()`:
-            Core function to continuously get the dominant color and send it
-            over the serial connection.
+            Core function to continuously get the dominant color of the
+            captured frames and send it over the serial connection.
         `start()`:
             Starts the process of sending the dominant color over the serial
             connection.
@@ -32,6 +213,10 @@ class ScreenResponsive:
             Stops the process.
         `update_fps(new_fps)`:
             Updates the frames per second (FPS) dynamically.
+        `update_sample_size(new_size)`:
+            Updates the number of pixels sampled along each axis.
+        `update_method(new_method)`:
+            Updates how the dominant color is picked.
         `select_snapshot(x, y, width, height)`:
             Selects a snapshot region for the screen.
         `clear_snapshot()`:
@@ -40,6 +225,8 @@ class ScreenResponsive:
             Checks if the process is running.
     """
 
+    METHODS = ("mean", "histogram", "kmeans")
+
     def __init__(self, conn, fps=10):
 
         """
@@ -55,15 +242,48 @@ class ScreenResponsive:
                 running.
             fps (int): Frames per second.
             frame_interval (float): Time per frame in seconds.
+            frame_period_ns (int): Time per frame in nanoseconds.
             snapshot (tuple or None): Snapshot region defined by
                 (x, y, width, height).
+            region (dict or None): Snapshot region passed to `mss.grab`.
+            SATURATION (float): Saturation boost applied to the dominant
+                color.
+            sample_size (int): Number of pixels sampled along each axis,
+                whatever the size of the captured region.
+            method (str): How the dominant color is picked, one of METHODS.
+            CLUSTERS (int): Number of color clusters of the "kmeans" method.
+            COHERENCE_THRESHOLD (float): Fraction of sampled pixels that must
+                change color before the "histogram" or "kmeans" dominant
+                color is recomputed.
+            frames (queue.Queue): Holds the latest captured frame, if the
+                color thread has not taken it yet.
         """
 
         self.conn = conn
         self.running = False
         self.fps = fps  # Frames per second (default 10)
         self.frame_interval = 1.0 / self.fps  # Time per frame in seconds
+        self.frame_period_ns = 10**9 // self.fps  # Time per frame in ns
         self.snapshot = None  # Snapshot region (x, y, width, height)
+        self.region = None  # Snapshot region as an mss monitor dict
+        self.SATURATION = 3
+        self.sample_size = 100  # Sample a grid of about 100x100 pixels
+        self.method = "mean"
+        self.CLUSTERS = 3
+        self._centers = None  # Cluster centers, carried over between frames
+        self._pixels = None  # Scratch float32 copy of the sample
+        self.COHERENCE_THRESHOLD = 0.03
+        self._last_histogram = None  # Coarse histogram of the last sample
+        self._last_color = None  # Dominant color of the last sample
+        self._sct = None  # mss instance, owned by the capture thread
+        self._monitor = None  # Primary monitor of the mss instance
+        self._screen_size = None  # Primary screen size, read once
+        self.frames = queue.Queue(maxsize=1)
+        self._camera = None  # dxcam instance, used instead of mss if present
+        self._frame = None  # Last (box, frame) pair delivered by dxcam
+        self._box = None  # Snapshot region as a dxcam (l, t, r, b) box
+        self._wake = threading.Event()  # Interrupts the wait between frames
+        self._threads = ()  # Capture and color threads of the current run
 
     # Dynamic bounding box calculation for active window
     def calculate_bounding_box(self):
@@ -71,27 +291,66 @@ class ScreenResponsive:
         """
         Calculate the bounding box of the screen.
 
-        This method captures the current screen size using the ImageGrab module
-        and returns a tuple representing the bounding box coordinates.
+        This method reads the primary monitor geometry from mss, without
+        capturing any pixels, and returns a tuple representing the bounding
+        box coordinates. The size is read once and cached.
 
         Returns:
             tuple: A tuple containing four integers (0, 0, screenX, screenY)
                    representing the bounding box of the screen.
         """
 
-        screensize = ImageGrab.grab().size
-        screenX, screenY = screensize
-        return (0, 0, screenX, screenY)
+        if self._screen_size is None:
+            with mss.mss() as sct:
+                monitor = sct.monitors[1]
+            self._screen_size = (monitor["width"], monitor["height"])
+        return (0, 0, *self._screen_size)
+
+    def grab_frame(self):
+
+        """
+        Capture the snapshot region, or the primary screen, as a BGRA array.
+
+        On Windows with dxcam installed, frames come from DXGI Desktop
+        Duplication, which only delivers a frame when the screen changed,
+        so the last frame is kept along with the region it was grabbed for.
+        dxcam is given the snapshot region, so only that region is copied
+        out of the mapped GPU staging texture. Otherwise only the region is
+        read from the framebuffer by mss and its raw bytes are wrapped
+        without copying.
 
-    # Function to get the dominant color using KMeans
+        Returns:
+            numpy.ndarray or None: A (height, width, 4) uint8 BGRA array, or
+                None if no frame has been delivered yet.
+        """
+
+        if dxcam is not None:
+            if self._camera is None:
+                self._camera = dxcam.create(output_idx=0, output_color="BGRA")
+            box = self._box
+            frame = self._camera.grab(region=box)
+            if frame is not None:
+                self._frame = (box, frame)
+            elif self._frame is None or self._frame[0] != box:
+                return None  # No frame of this region delivered yet
+            return self._frame[1]
+
+        if self._sct is None:
+            self._sct = mss.mss()
+            self._monitor = self._sct.monitors[1]
+
+        shot = self._sct.grab(self.region or self._monitor)
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(
+            shot.height, shot.width, 4
+        )
+
+    # Function to get the dominant color by averaging the captured pixels
     def get_dominant_color(self):
 
         """
         Get the dominant color from a screen snapshot.
-        This method captures a snapshot of the screen or a specified region of
-        the screen, enhances the color saturation, resizes the image for faster
-        processing, and then uses KMeans clustering to determine the dominant
-        color in the image.
+        This method captures the screen or a specified region of the screen
+        with `grab_frame` and returns its color from `dominant_color`.
         Returns:
             tuple: A tuple representing the RGB values of the dominant color.
         Raises:
@@ -100,82 +359,298 @@ class ScreenResponsive:
         """
 
         try:
-            if self.snapshot:
-                x, y, width, height = self.snapshot
-                image = ImageGrab.grab(bbox=(x, y, x + width, y + height))
-            else:
-                image = ImageGrab.grab()
+            return self.dominant_color(self.grab_frame())
+        except Exception as e:
+            print(f"Error: {e}")
+            return (0, 0, 0)
 
-            converter = ImageEnhance.Color(image)
-            image2 = converter.enhance(3)  # Optional: Enhance color saturation
+    def dominant_color(self, frame):
 
-            # Resize the image for faster processing
-            image_resized = image2.resize((100, 100))
+        """
+        Get the dominant color of a captured frame.
+        This method samples a grid of about `sample_size` pixels per axis of
+        the frame and, depending on `method`, averages them with `mean_bgr`,
+        picks their most common color with `histogram_color` or the center
+        of their largest cluster with `kmeans_color`. The first two kernels
+        are compiled with numba when it is installed. It then enhances the
+        saturation of the result. The strides are derived from the frame
+        size, so a 4K screen and a small snapshot region cost the same. The
+        strided slice is a view, so only the sampled pixels are ever read.
+        Screen content changes little from one frame to the next, so for the
+        "histogram" and "kmeans" methods a coarse histogram of the sample is
+        compared with the previous one first; if fewer than
+        `COHERENCE_THRESHOLD` of the pixels changed, the previous color is
+        reused, which also keeps the LEDs from flickering. The mean is
+        cheaper than that histogram and follows small changes, so it is
+        always computed. The histogram and color are only stored once the
+        color was computed, so a failed frame is never reused.
+        Args:
+            frame (numpy.ndarray or None): A (height, width, 4) uint8 BGRA
+                frame, as returned by `grab_frame`.
+        Returns:
+            tuple: A tuple representing the RGB values of the dominant color,
+                (0, 0, 0) if there is no frame.
+        """
 
-            # Convert image to numpy array
-            image_np = np.array(image_resized)
-            image_np = image_np.reshape((-1, 3))  # Reshape to (pixels, RGB)
+        if frame is None:
+            return (0, 0, 0)
 
-            # KMeans clustering for dominant color
-            kmeans = KMeans(n_clusters=1, random_state=0)
-            kmeans.fit(image_np)
+        # Sample a grid of about sample_size pixels per axis, dropping alpha
+        height, width = frame.shape[:2]
+        step_y = max(1, height // self.sample_size)
+        step_x = max(1, width // self.sample_size)
+        sample = frame[::step_y, ::step_x, :3]
+
+        if self.method == "mean":
+            blue, green, red = mean_bgr(sample)  # Reordered to RGB below
+            return self.enhance_color((red, green, blue))
+
+        # Reuse the previous color if the sample barely changed
+        histogram = self.coarse_histogram(sample)
+        if self._last_histogram is not None:
+            changed = np.abs(histogram - self._last_histogram).sum()
+            if changed < 2 * self.COHERENCE_THRESHOLD * histogram.sum():
+                return self._last_color
+
+        if self.method == "histogram":
+            color = self.enhance_color(self.histogram_color(sample))
+        else:
+            color = self.enhance_color(self.kmeans_color(sample))
+        self._last_histogram = histogram
+        self._last_color = color
+        return color
+
+    def histogram_color(self, sample):
 
-            # Get the dominant color (cluster center)
-            dominant_color = tuple(map(int, kmeans.cluster_centers_[0]))
+        """
+        Get the most common color of the sampled pixels.
 
-            return dominant_color
+        Each pixel is quantized to 5 bits per channel and packed into a
+        15-bit key, so the mode is found by counting the keys with
+        `mode_key` instead of any clustering.
 
-        except Exception as e:
-            print(f"Error: {e}")
-            return (0, 0, 0)
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels.
 
-    def core(self):
+        Returns:
+            tuple: The (red, green, blue) center of the most common bucket.
+        """
+
+        key = int(mode_key(sample))
+        return (
+            ((key >> 10) & 31) << 3 | 4,
+            ((key >> 5) & 31) << 3 | 4,
+            (key & 31) << 3 | 4,
+        )
+
+    def kmeans_color(self, sample):
+
+        """
+        Get the center of the largest color cluster of the sampled pixels.
+
+        The pixels are clustered into `CLUSTERS` colors by a few `lloyd`
+        iterations in NumPy, starting from the centers of the previous frame,
+        which converge almost at once on coherent screen content and do not
+        jump around between frames. The first frame is seeded with evenly
+        spaced pixels of the sample. The strided sample is converted into a
+        scratch buffer that is only reallocated when the sample size
+        changes.
+
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels.
+
+        Returns:
+            tuple: The (red, green, blue) center of the largest cluster.
+        """
+
+        height, width = sample.shape[:2]
+        if self._pixels is None or len(self._pixels) != height * width:
+            self._pixels = np.empty((height * width, 3), dtype=np.float32)
+        np.copyto(self._pixels.reshape(height, width, 3), sample)
+        pixels = self._pixels
+        if self._centers is None or len(self._centers) != self.CLUSTERS:
+            seeds = np.linspace(0, len(pixels) - 1, self.CLUSTERS).astype(int)
+            self._centers = pixels[seeds]
+        self._centers, labels = lloyd(pixels, self._centers)
+        largest = np.bincount(labels, minlength=self.CLUSTERS).argmax()
+        blue, green, red = self._centers[largest]
+        return red, green, blue
+
+    def coarse_histogram(self, sample):
+
+        """
+        Get a coarse color histogram of the sampled pixels.
+
+        Each channel is quantized to 3 bits, giving 512 buckets, which is
+        enough to tell whether the screen content changed.
+
+        Args:
+            sample (numpy.ndarray): The sampled (height, width, 3) uint8 BGR
+                pixels.
+
+        Returns:
+            numpy.ndarray: The pixel count of each of the 512 buckets.
+        """
+
+        keys = (
+            (sample[..., 2] >> 5).astype(np.uint16) << 6
+            | (sample[..., 1] >> 5).astype(np.uint16) << 3
+            | (sample[..., 0] >> 5)
+        )
+        return np.bincount(keys.ravel(), minlength=512).astype(np.int32)
+
+    def enhance_color(self, color):
+
+        """
+        Boost the saturation of a color by `SATURATION`.
+
+        The color is pushed away from its grayscale luminance the same way
+        PIL's `ImageEnhance.Color` does, but on a single averaged color
+        instead of on every pixel of the captured image.
+
+        Args:
+            color (tuple): The (red, green, blue) color to enhance.
+
+        Returns:
+            tuple: The enhanced color as integers ranging from 0 to 255.
+        """
+
+        red, green, blue = color
+        gray = red * 0.299 + green * 0.587 + blue * 0.114
+        return tuple(
+            int(min(max(gray + self.SATURATION * (c - gray), 0), 255))
+            for c in color
+        )
+
+    def capture_loop(self):
 
         """
-        Core loop that continuously gets the dominant color from the screen
-        and sends the RGB values over a serial connection.
+        Capture loop that grabs frames at the set FPS rate and hands them to
+        the color thread running `core`.
         This method runs in a loop while `self.running` is True.
         It performs the following steps:
-        1. Gets the dominant color from the screen.
-        2. Extracts the RGB values from the dominant color.
-        3. Sends the RGB values over a serial connection.
-        4. Sleeps for a duration defined by `self.frame_interval` to maintain
-        the set FPS rate. If an exception occurs during the execution of the
-        loop, it is caught and ignored.
+        1. Grabs a frame of the screen or snapshot region.
+        2. Puts it in the single-slot `frames` queue, replacing the previous
+        frame if `core` has not taken it yet, so only the latest frame is
+        ever processed.
+        3. Waits for the next tick of a schedule advancing by
+        `self.frame_period_ns`, measured with `time.monotonic_ns`, so the
+        set FPS rate is kept without drifting. After a stall the schedule
+        restarts from the current time instead of bursting to catch up. The
+        wait is cut short by `stop` and `update_fps`, so both take effect
+        immediately.
+        Capture errors are printed and the frame is skipped.
         Attributes:
             self.running (bool): A flag to control the execution of the loop.
-            self.frame_interval (float): The interval (in seconds) to sleep
-                between iterations to control the FPS rate.
-            self.conn (object): The connection object used to send RGB data
-                over serial.
+            self.frame_period_ns (int): The period (in nanoseconds) of one
+                iteration, which controls the FPS rate.
+            self.frames (queue.Queue): The queue the frames are put in.
         """
 
-        self.running = True
         try:
+            next_ns = time.monotonic_ns()
             while self.running:
-                # Get the dominant color
-                dominant_color = self.get_dominant_color()
-                r, g, b = dominant_color
-                # Send RGB data over serial
-                self.conn.send_color(r, g, b)
-                # print(f"Sent RGB: {r},{g},{b}")
+                try:
+                    frame = self.grab_frame()
+                except Exception as e:
+                    print(f"Error: {e}")
+                    frame = None
+
+                if frame is not None:
+                    # Drop the frame still waiting, if any, for the new one
+                    try:
+                        self.frames.put_nowait(frame)
+                    except queue.Full:
+                        try:
+                            self.frames.get_nowait()
+                        except queue.Empty:
+                            pass
+                        self.frames.put_nowait(frame)
+
+                # Wait for the next tick of a fixed schedule, so the time
+                # spent on the frame does not add up to a lower FPS rate
+                next_ns += self.frame_period_ns
+                delay_ns = next_ns - time.monotonic_ns()
+                if delay_ns > 0:
+                    if self._wake.wait(delay_ns / 1e9):
+                        # Woken by stop or update_fps, start a new schedule
+                        self._wake.clear()
+                        next_ns = time.monotonic_ns()
+                else:
+                    # Fell behind, resync rather than rush to catch up
+                    next_ns = time.monotonic_ns()
+
+        finally:
+            if self._sct is not None:
+                self._sct.close()
+                self._sct = None
 
-                # Sleep to maintain the set FPS rate
-                time.sleep(self.frame_interval)
+    def core(self):
 
-        except Exception:
-            pass
+        """
+        Core loop that continuously gets the dominant color of the captured
+        frames and sends the RGB values over a serial connection.
+        This method runs in a loop while `self.running` is True, on its own
+        thread, so computing the color of a frame overlaps with capturing
+        the next one in `capture_loop`.
+        It performs the following steps:
+        1. Takes the latest frame from `frames`, waiting for one if needed.
+        2. Gets the dominant color of the frame.
+        3. Sends the RGB values over a serial connection.
+        If an exception occurs while processing a frame, it is printed and
+        the frame is skipped.
+        Attributes:
+            self.running (bool): A flag to control the execution of the loop.
+            self.frames (queue.Queue): The queue the frames are taken from.
+            self.conn (object): The connection object used to send RGB data
+                over serial.
+        """
+
+        while self.running:
+            try:
+                frame = self.frames.get(timeout=0.1)
+            except queue.Empty:
+                continue  # Check the running flag again
+            try:
+                r, g, b = self.dominant_color(frame)
+                # Send RGB data over serial, unless stopped meanwhile
+                if self.running:
+                    self.conn.send_color(r, g, b)
+            except Exception as e:
+                print(f"Error: {e}")
 
     def start(self):
 
         """
-        Starts the core function in a new thread.
-
-        This method creates and starts a new thread that runs the `core
-        method. It allows the `core` method to execute asynchronously.
+        Starts the capture and the core function in new threads.
+
+        This method creates and starts one thread that runs `capture_loop`
+        and another that runs the `core` method, so capturing a frame and
+        computing the color of the previous one run in parallel, since both
+        the capture backends and NumPy release the GIL. Both threads are
+        daemons and their handles are kept so that `stop` can join them.
+        Threads of a previous run that did not exit in time are joined first,
+        so they cannot resume once the running flag is set again.
+        The running flag is set before the threads start so that a `stop`
+        issued right away is never lost, and calling `start` while the
+        capture is already running does nothing.
         """
 
-        threading.Thread(target=self.core).start()
+        if self.running:
+            return
+        for thread in self._threads:
+            thread.join()
+        self.running = True
+        self._wake.clear()
+        self.frames = queue.Queue(maxsize=1)  # Drop frames of a past run
+        self._threads = (
+            threading.Thread(target=self.capture_loop, daemon=True),
+            threading.Thread(target=self.core, daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
 
     def stop(self):
 
@@ -185,11 +660,20 @@ class ScreenResponsive:
 
         This method sends a command to the LED controller to switch its mode
         to "OFF" and sets the running` attribute to `False` to indicate that
-        the controller is no longer active.
+        the controller is no longer active. The capture thread is woken up
+        so that it exits without waiting for the rest of its frame interval.
+        Both threads are then joined for up to two frame intervals each, so
+        no color computed by the last frame reaches the LEDs after they are
+        switched off. A thread never joins itself.
         """
 
-        self.conn.set_mode("OFF")
         self.running = False
+        self._wake.set()
+        current = threading.current_thread()
+        for thread in self._threads:
+            if thread is not current:
+                thread.join(timeout=2 * self.frame_interval)
+        self.conn.set_mode("OFF")
 
     def update_fps(self, new_fps):
 
@@ -204,6 +688,38 @@ class ScreenResponsive:
 
         self.fps = new_fps
         self.frame_interval = 1.0 / self.fps
+        self.frame_period_ns = 10**9 // self.fps
+        self._wake.set()  # Apply the new interval to the pending wait
+
+    def update_sample_size(self, new_size):
+
+        """
+        Update the number of pixels sampled along each axis when averaging a
+        frame.
+
+        Args:
+            new_size (int): The number of pixels to sample along each axis.
+        """
+
+        self.sample_size = max(1, int(new_size))
+        self._last_histogram = None
+
+    def update_method(self, new_method):
+
+        """
+        Update how the dominant color is picked.
+
+        Args:
+            new_method (str): One of METHODS, "mean" for the average color,
+                "histogram" for the most common color or "kmeans" for the
+                center of the largest color cluster.
+        """
+
+        if new_method in self.METHODS:
+            self.method = new_method
+            self._last_histogram = None
+        else:
+            print(f"Unknown color method: {new_method}")
 
     def select_snapshot(self, x, y, width, height):
 
@@ -221,17 +737,23 @@ class ScreenResponsive:
         """
 
         self.snapshot = (x, y, width, height)
+        self.region = {"left": x, "top": y, "width": width, "height": height}
+        self._box = (x, y, x + width, y + height)
+        self._last_histogram = None
 
     def clear_snapshot(self):
 
         """
         Clears the current snapshot.
 
-        This method sets the snapshot attribute to None, effectively clearing
-        any stored snapshot data.
+        This method sets the snapshot and region attributes to None, so the
+        whole primary screen is captured again.
         """
 
         self.snapshot = None
+        self.region = None
+        self._box = None
+        self._last_histogram = None
 
     def is_running(self):
 
@@ -1,7 +1,9 @@
 import serial
 import serial.tools.list_ports
+import struct
 import time
 import threading
+from collections import deque
 
 
 class SerialConnection:
@@ -10,12 +12,21 @@ class SerialConnection:
     A class to manage the serial connection to an Arduino for controlling LED
     modes and colors.
     Attributes:
+        MODES (dict): The command code of each mode.
+        MODE_PACKETS (dict): Prebuilt packet of each mode.
+        TIMEOUT_PACKETS (tuple): Prebuilt packets disabling and enabling the
+            timeout.
         port (str): The serial port to connect to.
         baudrate (int): The baud rate for the serial connection.
         debug (bool): Flag to enable debug messages.
         arduino (serial.Serial): The serial connection object.
         stop_thread (bool): Flag to control the thread for printing serial
             data.
+        writer (threading.Thread): Background thread writing queued packets.
+        tx_buffer (bytearray): Color packet buffer reused by the writer.
+        timeout_enabled (bool): Whether the Arduino timeout is enabled.
+        last_color (tuple or None): The last color queued, None if the next
+            color must be sent regardless.
     Methods:
         `send_timeout(enabled: bool = False)`:
             Enable or disable the timeout feature on the Arduino.
@@ -23,6 +34,10 @@ class SerialConnection:
             Set the mode on the Arduino by sending a specific command code.
         `send_color(red: int, green: int, blue: int)`:
             Send RGB color values with a header to indicate color update.
+        `queue_packet(packet: bytes)`:
+            Queue a packet to be written by the writer thread.
+        `writer_loop()`:
+            Write queued packets to the Arduino, oldest first.
         `print_serial()`:
             Continuously print serial data from the Arduino until stopped.
         `get_ports()` -> dict:
@@ -41,6 +56,22 @@ class SerialConnection:
             Stop the thread and close the serial connection.
     """
 
+    MODES = {
+        "OFF": 0,
+        "Solid": 0,
+        "Fade": 1,
+        "Cycle": 2,
+        "Rainbow Cycle": 3,
+        "Breathing": 4,
+        "Random": 5
+    }
+    # Control packets only take a few values, so they are built once for
+    # the class. They stay immutable since they may wait in the queue.
+    MODE_PACKETS = {
+        mode: bytes([0x02, code]) for mode, code in MODES.items()
+    }
+    TIMEOUT_PACKETS = (bytes([0x01, 0]), bytes([0x01, 1]))
+
     def __init__(self, port, baudrate=9600, debug=False):
 
         """
@@ -60,6 +91,21 @@ class SerialConnection:
         self.stop_thread = False  # Flag to control the thread
         self.debug = debug
 
+        # Packets waiting for the writer thread, oldest first. Colors are
+        # queued as (red, green, blue) tuples and packed by the writer into
+        # its own preallocated buffer.
+        self.tx_queue = deque()
+        self.tx_buffer = bytearray([0x03, 0, 0, 0])
+        self.color_packer = struct.Struct("BBB")
+        self.tx_condition = threading.Condition()
+        self.writer = threading.Thread(target=self.writer_loop, daemon=True)
+        self.writer.start()
+
+        # Repeated colors are dropped, unless the Arduino timeout is enabled
+        # and needs them to keep the LEDs on
+        self.timeout_enabled = False
+        self.last_color = None
+
     def send_timeout(self, enabled: bool = False):
 
         """
@@ -75,10 +121,10 @@ class SerialConnection:
 
         if not self.arduino or not self.arduino.is_open:
             return
-        val = 1 if enabled else 0
         if self.debug:
             print(f"Setting timeout: {'Enabled' if enabled else 'Disabled'}")
-        self.arduino.write(bytes([0x01, val]))
+        self.timeout_enabled = enabled
+        self.queue_packet(self.TIMEOUT_PACKETS[1 if enabled else 0])
 
     def set_mode(self, mode):
 
@@ -101,19 +147,12 @@ class SerialConnection:
 
         if not self.arduino or not self.arduino.is_open:
             return
-        modes = {
-            "OFF": 0,
-            "Solid": 0,
-            "Fade": 1,
-            "Cycle": 2,
-            "Rainbow Cycle": 3,
-            "Breathing": 4,
-            "Random": 5
-        }
-        if mode in modes:
+        packet = self.MODE_PACKETS.get(mode)
+        if packet is not None:
             if self.debug:
                 print(f"Setting mode: {mode}")
-            self.arduino.write(bytes([0x02, modes[mode]]))
+            self.last_color = None  # The mode change overrides the color
+            self.queue_packet(packet)
         else:
             print(f"Unknown mode: {mode}")
 
@@ -122,6 +161,13 @@ class SerialConnection:
         """
         Sends RGB color values to the connected Arduino.
 
+        The color is handed to the writer thread, so the caller never waits
+        on the serial port. If a color is still waiting at the end of the
+        queue, it is replaced by this one, so the latest color wins. No
+        packet is built here; the writer packs the color into its reusable
+        buffer. A color equal to the last one is dropped, unless the timeout
+        is enabled, in which case every color also acts as a keep-alive.
+
         Parameters:
         red (int): The red color value (0-255).
         green (int): The green color value (0-255).
@@ -133,24 +179,83 @@ class SerialConnection:
 
         if not self.arduino or not self.arduino.is_open:
             return
+        color = (red, green, blue)
+        if color == self.last_color and not self.timeout_enabled:
+            return
+        self.last_color = color
         if self.debug:
             print(f"Sending RGB: {red}, {green}, {blue}")
-        self.arduino.write(bytes([0x03, red, green, blue]))
+        with self.tx_condition:
+            if self.tx_queue and type(self.tx_queue[-1]) is tuple:
+                self.tx_queue[-1] = color
+            else:
+                self.tx_queue.append(color)
+            self.tx_condition.notify()
+
+    def queue_packet(self, packet):
+
+        """
+        Queue a packet to be written to the Arduino by the writer thread.
+
+        Packets are written in the order they are queued, so mode and timeout
+        commands keep their position relative to color updates.
+
+        Parameters:
+        packet (bytes): The packet to write, starting with its header byte.
+
+        Returns:
+        None
+        """
+
+        with self.tx_condition:
+            self.tx_queue.append(packet)
+            self.tx_condition.notify()
+
+    def writer_loop(self):
+
+        """
+        Write queued packets to the Arduino, oldest first.
+
+        This method runs on the writer thread for the lifetime of the
+        connection object. It blocks until a packet is queued, then writes it
+        outside of the lock so that producers are never held up by the serial
+        port. Colors are packed into `tx_buffer` in place, so writing a color
+        allocates nothing. Packets queued while the port is closed are
+        dropped.
+        """
+
+        while True:
+            with self.tx_condition:
+                while not self.tx_queue:
+                    self.tx_condition.wait()
+                packet = self.tx_queue.popleft()
+
+            try:
+                if type(packet) is tuple:
+                    self.color_packer.pack_into(self.tx_buffer, 1, *packet)
+                    packet = self.tx_buffer
+                if self.arduino and self.arduino.is_open:
+                    self.arduino.write(packet)
+            except struct.error as e:
+                print(f"Invalid color: {e}")
+            except (serial.SerialException, OSError) as e:
+                print(f"Error writing to serial: {e}")
 
     def print_serial(self):
 
         """
         Continuously print serial data from the Arduino until stopped.
 
-        This method runs in a loop, checking if there is any data available
-        to read from the Arduino. If data is available, it reads the data,
-        decodes it using UTF-8 encoding (ignoring errors), and prints it to
-        the console. If a UnicodeDecodeError occurs during decoding, it
-        catches the exception and prints an error message.
+        This method runs in a loop, blocking in `readline` until a line
+        arrives from the Arduino or the read timeout set by `connect`
+        expires. If a line was read, it decodes it using UTF-8 encoding
+        (ignoring errors), and prints it to the console. If a
+        UnicodeDecodeError occurs during decoding, it catches the exception
+        and prints an error message.
 
         The loop continues to run until the `stop_thread` attribute is set
-        to True. A small delay is added at the end of each loop iteration
-        to prevent high CPU usage.
+        to True, which is noticed within one read timeout. The thread sleeps
+        in the serial driver while no data arrives instead of polling.
 
         Attributes:
             stop_thread (bool): A flag to stop the loop when set to True.
@@ -158,15 +263,14 @@ class SerialConnection:
         """
 
         while not self.stop_thread:
-            if self.arduino.in_waiting > 0:
-                try:
-                    data = self.arduino.readline().decode(
-                        'utf-8', errors='ignore'
-                    ).strip()
-                    print("Serial Print: " + data)
-                except UnicodeDecodeError as e:
-                    print(f"Error decoding data: {e}")
-            time.sleep(0.1)  # Small delay to prevent high CPU usage
+            line = self.arduino.readline()
+            if not line:
+                continue  # Timed out, check stop_thread again
+            try:
+                data = line.decode('utf-8', errors='ignore').strip()
+                print("Serial Print: " + data)
+            except UnicodeDecodeError as e:
+                print(f"Error decoding data: {e}")
 
     def get_ports(self):
 
@@ -243,6 +347,8 @@ class SerialConnection:
         the specified port and baud rate. If the connection is already open,
         it does nothing. If the connection is not open, it initializes the
         connection and waits for 2 seconds to allow the Arduino to reset.
+        Reads time out after 0.5 seconds, so the `print_serial` thread can
+        block on them and still notice when it is asked to stop.
 
         Raises:
             serial.SerialException: If there is an error opening the serial
@@ -250,8 +356,11 @@ class SerialConnection:
         """
 
         if not self.arduino or not self.arduino.is_open:
-            self.arduino = serial.Serial(self.port, self.baudrate)
+            self.arduino = serial.Serial(self.port, self.baudrate, timeout=0.5)
             time.sleep(2)  # Allow time for the Arduino to reset
+            # The reset cleared the Arduino state
+            self.timeout_enabled = False
+            self.last_color = None
 
     def disconnect(self):
 